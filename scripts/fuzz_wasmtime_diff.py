@@ -24,6 +24,10 @@ The JIT SIMD body codegen itself is verified correct (matches wasmtime on
 wrapper-friendly funcs; simd_assert 25075/0).
 """
 import subprocess, glob, re, sys, struct, math, os, shutil
+from concurrent.futures import ThreadPoolExecutor
+
+INT_RE = re.compile(r"-?\d+")
+FUNC_EXPORT_RE = re.compile(r'\(export "([A-Za-z0-9_]+)" \(func')
 
 
 def find_zwasm():
@@ -34,8 +38,11 @@ def find_zwasm():
 
 
 def inv(cmd):
+    # close_fds=False + an argv[0] with a directory part lets subprocess
+    # take its posix_spawn fast path instead of fork+exec. The pipes it
+    # creates are O_CLOEXEC already, so concurrent calls leak nothing.
     try:
-        r = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+        r = subprocess.run(cmd, capture_output=True, text=True, timeout=10, close_fds=False)
         return (r.returncode, r.stdout.strip(), r.stderr.strip())
     except Exception:
         return (-1, "", "<timeout>")
@@ -43,7 +50,7 @@ def inv(cmd):
 
 def norm(s):
     s = s.strip().splitlines()[-1] if s.strip() else ""
-    if re.fullmatch(r"-?\d+", s):
+    if INT_RE.fullmatch(s):
         return ("i", int(s))
     try:
         f = float(s)
@@ -52,36 +59,55 @@ def norm(s):
         return None
 
 
+def compare(zwasm, wasmtime, f, n):
+    """Run export `n` of `f` under both engines. Returns None when the pair
+    is not comparable (sig limitation, both trap, unparsable output), ""
+    on a match, else the mismatch line."""
+    wrc, wo, we = inv([wasmtime, "run", "--invoke", n, f])
+    zrc, zo, ze = inv([zwasm, "run", "--engine", "jit", "--invoke", n, f])
+    if "unsupportedop" in (zo + ze).lower():
+        return None  # wrapper_thunk sig limitation — not a divergence
+    wl = (wo + we).lower()
+    wt_trap = wrc != 0 or any(t in wl for t in ("trap", "unreachable", "out of bounds", "divide by zero"))
+    zw_trap = zrc != 0 or "trap" in (zo + ze).lower()
+    if wt_trap or zw_trap:
+        if wt_trap != zw_trap:
+            return f"{os.path.basename(f)}::{n} TRAP-DIVERGE wt_trap={wt_trap} zw_trap={zw_trap}"
+        return None
+    nw, nz = norm(wo), norm(zo)
+    if nw is None or nz is None:
+        return None
+    if nw != nz:
+        return f"{os.path.basename(f)}::{n} wt={wo[-30:]!r} zw={zo[-30:]!r}"
+    return ""
+
+
 def main():
     corpus = sys.argv[1] if len(sys.argv) > 1 else "test/fuzz/corpus/exec_seed"
-    if not shutil.which("wasmtime") or not shutil.which("wasm-tools"):
+    wasmtime, wasm_tools = shutil.which("wasmtime"), shutil.which("wasm-tools")
+    if not wasmtime or not wasm_tools:
         sys.exit("need wasmtime + wasm-tools on PATH (nix develop .#gen)")
     zwasm = find_zwasm()
+    pairs = []
+    for f in sorted(glob.glob(corpus + "/*.wasm")):
+        # Only the text listing is scanned; let stderr go to /dev/null
+        # rather than buffering and decoding it for nothing.
+        pr = subprocess.run([wasm_tools, "print", f], stdout=subprocess.PIPE,
+                            stderr=subprocess.DEVNULL, text=True, close_fds=False).stdout
+        pairs.extend((f, n) for n in FUNC_EXPORT_RE.findall(pr))
+    # Each export is two independent child processes; the time is spent
+    # blocked in subprocess.run (GIL released), so a thread pool overlaps
+    # them across cores. map() keeps the report in corpus order.
     compared = mism = 0
     mm = []
-    for f in sorted(glob.glob(corpus + "/*.wasm")):
-        pr = subprocess.run(["wasm-tools", "print", f], capture_output=True, text=True).stdout
-        for n in re.findall(r'\(export "([A-Za-z0-9_]+)" \(func', pr):
-            wrc, wo, we = inv(["wasmtime", "run", "--invoke", n, f])
-            zrc, zo, ze = inv([zwasm, "run", "--engine", "jit", "--invoke", n, f])
-            if "unsupportedop" in (zo + ze).lower():
-                continue  # wrapper_thunk sig limitation — not a divergence
-            wl = (wo + we).lower()
-            wt_trap = wrc != 0 or any(t in wl for t in ("trap", "unreachable", "out of bounds", "divide by zero"))
-            zw_trap = zrc != 0 or "trap" in (zo + ze).lower()
-            if wt_trap or zw_trap:
-                if wt_trap != zw_trap:
-                    compared += 1
-                    mism += 1
-                    mm.append(f"{os.path.basename(f)}::{n} TRAP-DIVERGE wt_trap={wt_trap} zw_trap={zw_trap}")
-                continue
-            nw, nz = norm(wo), norm(zo)
-            if nw is None or nz is None:
+    with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as pool:
+        for verdict in pool.map(lambda p: compare(zwasm, wasmtime, *p), pairs):
+            if verdict is None:
                 continue
             compared += 1
-            if nw != nz:
+            if verdict:
                 mism += 1
-                mm.append(f"{os.path.basename(f)}::{n} wt={wo[-30:]!r} zw={zo[-30:]!r}")
+                mm.append(verdict)
     print(f"compared={compared} mismatch={mism}")
     for m in mm[:30]:
         print(m)
@@ -0,0 +1,83 @@
+# Shared JOBS-wide fan-out for the spec regen and misc-sweep scripts.
+# Source it after the caller's `cd` to the repo root:
+#
+#   . scripts/lib/bake_jobs.sh
+#   run_bakes bake_one "${NAMES[@]}"    # strict: first failure aborts
+#   run_jobs run_one "${FILES[@]}"      # best-effort: statuses ignored
+#
+# Environment:
+#   JOBS=N   concurrent jobs (default: online CPU count; JOBS=1
+#            restores the serial walk).
+#
+# Each job runs `<fn> <arg>` in a background subshell with job control
+# on, so it leads its own process group and the wasm-tools / python3
+# children it starts can be killed along with it. Jobs are reaped in
+# completion order with `wait -n -p` over the launched pids (bash >= 5.1):
+# naming the pids also covers jobs that finished before the throttle
+# engaged, whose status a plain `wait -n` / `jobs -p` walk would lose.
+
+JOBS=${JOBS:-$(getconf _NPROCESSORS_ONLN 2>/dev/null || echo 4)}
+
+# Launched, not yet reaped.
+_job_pids=()
+
+_job_start() {
+  set -m
+  "$@" &
+  set +m
+  _job_pids+=("$!")
+}
+
+# Wait for the next job to finish, drop it from _job_pids, and return
+# its status.
+_job_reap() {
+  local done_pid="" p st=0
+  wait -n -p done_pid "${_job_pids[@]}" || st=$?
+  local -a left=()
+  for p in "${_job_pids[@]}"; do
+    [ "$p" = "$done_pid" ] || left+=("$p")
+  done
+  _job_pids=("${left[@]}")
+  return "$st"
+}
+
+# Kill every job still running, process group and all.
+_job_kill_all() {
+  local p
+  for p in "${_job_pids[@]}"; do
+    kill -- -"$p" 2>/dev/null || true
+  done
+}
+
+# run_bakes <fn> <name>... — run `<fn> <name>` for each name, at most
+# JOBS at a time. The first failing job (in completion order) kills the
+# rest — children included, so they stop writing $DEST/<name>/ — and
+# exits the script with that job's status.
+run_bakes() {
+  local fn="$1" n
+  shift
+  _job_pids=()
+  trap _job_kill_all EXIT
+  for n in "$@"; do
+    while [ "${#_job_pids[@]}" -ge "$JOBS" ]; do _job_reap || exit $?; done
+    _job_start "$fn" "$n"
+  done
+  while [ "${#_job_pids[@]}" -gt 0 ]; do _job_reap || exit $?; done
+  trap - EXIT
+}
+
+# run_jobs <fn> <arg>... — as run_bakes, but job statuses are ignored:
+# for sweeps whose jobs record their own verdicts. An interrupted
+# sweep still kills its in-flight jobs.
+run_jobs() {
+  local fn="$1" n
+  shift
+  _job_pids=()
+  trap _job_kill_all EXIT
+  for n in "$@"; do
+    while [ "${#_job_pids[@]}" -ge "$JOBS" ]; do _job_reap || true; done
+    _job_start "$fn" "$n"
+  done
+  while [ "${#_job_pids[@]}" -gt 0 ]; do _job_reap || true; done
+  trap - EXIT
+}
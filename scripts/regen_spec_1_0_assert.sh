@@ -76,10 +76,16 @@ for n in "${NAMES[@]}"; do
   mkdir -p "$out_dir"
 
   python3 - "$TMP/$n.json" "$out_dir/manifest.txt" <<'PY'
-import json, sys
+import functools, json, sys
 src, dst = sys.argv[1], sys.argv[2]
-d = json.load(open(src))
+with open(src, 'rb') as f:
+    d = json.load(f)
+INT_TYPES = frozenset({'i32', 'i64'})
+SCALAR_TYPES = INT_TYPES | {'f32', 'f64'}
 def fmt(v):
+    return _fmt_value(v['type'], v['value'])
+@functools.lru_cache(maxsize=None)
+def _fmt_value(t, val):
     # D-290 baker normalization (wabt wast2json → wasm-tools
     # json-from-wast): wabt emits i32/i64 values UNSIGNED
     # (4294967295); wasm-tools emits them SIGNED (-1), sometimes as a
@@ -87,9 +93,7 @@ def fmt(v):
     # runner manifest use unsigned decimals — fold any negative into
     # its unsigned width here, accepting both str and int inputs.
     # f32/f64 are bit-pattern decimals in both tools (identical) → pass.
-    val = v['value']
-    t = v['type']
-    if t in ('i32', 'i64'):
+    if t in INT_TYPES:
         n = int(val)
         if n < 0:
             n += (1 << 32) if t == 'i32' else (1 << 64)
@@ -100,6 +104,11 @@ def norm_wasm(fn):
     # compiled `.wasm`; the copy loop converts via `wasm-tools parse`,
     # so normalize the manifest name to its `.wasm` form here.
     return fn[:-4] + '.wasm' if fn.endswith('.wat') else fn
+# 7.5-close-d: relax arg filter to allow f32/f64 alongside i32/i64.
+# Runner dispatches the supported single-FP-arg shapes; multi-arg +
+# mixed-FP shapes still gate via the `more-than-5-args` filter below.
+def allowed_arg(x):
+    return x['type'] in SCALAR_TYPES
 lines = []
 for c in d['commands']:
     t = c.get('type')
@@ -112,11 +121,6 @@ for c in d['commands']:
             continue
         args = a.get('args', [])
         results = c.get('expected', [])
-        # 7.5-close-d: relax arg filter to allow f32/f64 alongside
-        # i32/i64. Runner dispatches the supported single-FP-arg
-        # shapes; multi-arg + mixed-FP shapes still gate via the
-        # `more-than-2-args` filter below.
-        allowed_arg = lambda x: x['type'] in ('i32', 'i64', 'f32', 'f64')
         if not all(allowed_arg(x) for x in args):
             lines.append(f'skip-impl non-int-arg {a["field"]}')
             continue
@@ -125,7 +129,7 @@ for c in d['commands']:
         # results flow through via callF32* / callF64* helpers.
         # Multi-result (Wasm 2.0) still skip-impl pending runner
         # extension.
-        if len(results) > 1 or any(r['type'] not in ('i32', 'i64', 'f32', 'f64') for r in results):
+        if len(results) > 1 or any(r['type'] not in SCALAR_TYPES for r in results):
             lines.append(f'skip-impl non-int-result {a["field"]}')
             continue
         # 7.5-close-mta: lift cap to 5; runner has callXX_<5-args>
@@ -143,7 +147,7 @@ for c in d['commands']:
             lines.append(f'skip-impl trap-non-invoke')
             continue
         args = a.get('args', [])
-        if any(x['type'] not in ('i32', 'i64') for x in args):
+        if any(x['type'] not in INT_TYPES for x in args):
             lines.append(f'skip-impl trap-non-int-arg {a["field"]}')
             continue
         if len(args) > 2:
@@ -18,6 +18,9 @@
 #   bash scripts/regen_spec_3_0_assert.sh <proposal> <name>
 #       Bake a specific .wast (must exist in raw/).
 #
+# Environment:
+#   JOBS=N   concurrent smoke-set bakes (see scripts/lib/bake_jobs.sh).
+#
 # Per Phase 10 design plan §4.6 corpus 取り込み手順 step 2.
 
 set -euo pipefail
@@ -213,7 +216,8 @@ bake_one() {
     python3 - "$tmp/$name.json" "$out_dir/manifest.txt" <<'PY'
 import json, sys
 src, dst = sys.argv[1], sys.argv[2]
-d = json.load(open(src))
+with open(src, 'rb') as f:
+    d = json.load(f)
 def fmt(v):
     # Bake JSON value normalization (cycle 90 baker swap from wabt
     # wast2json → wasm-tools json-from-wast). wabt emits i32/i64
@@ -383,19 +387,26 @@ PY
     trap - RETURN
 
     local n_mod n_ret n_trap
-    n_mod=$(grep -c '^module ' "$out_dir/manifest.txt" || true)
-    n_ret=$(grep -c '^assert_return ' "$out_dir/manifest.txt" || true)
-    n_trap=$(grep -c '^assert_trap ' "$out_dir/manifest.txt" || true)
+    read -r n_mod n_ret n_trap < <(awk '
+        /^module /        { m++ }
+        /^assert_return / { r++ }
+        /^assert_trap /   { t++ }
+        END { print m + 0, r + 0, t + 0 }' "$out_dir/manifest.txt")
     printf "[bake] %-22s %-15s module=%-3s return=%-4s trap=%-3s\n" \
         "$proposal" "$name" "$n_mod" "$n_ret" "$n_trap"
 }
 
+# Smoke-set entry `<proposal>/<name>`. A failed bake is reported and
+# skipped, as in the serial loop (`|| true` also keeps bake_one out of
+# errexit, as it was there).
+bake_entry() {
+    bake_one "${1%/*}" "${1#*/}" || true
+}
+
 if [ $# -eq 2 ]; then
     bake_one "$1" "$2"
 else
-    for entry in "${SMOKE[@]}"; do
-        proposal="${entry%/*}"
-        name="${entry#*/}"
-        bake_one "$proposal" "$name" || true
-    done
+    # `[bake]` lines arrive in completion order under JOBS>1.
+    . scripts/lib/bake_jobs.sh
+    run_jobs bake_entry "${SMOKE[@]}"
 fi
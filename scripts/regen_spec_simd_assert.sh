@@ -167,11 +167,18 @@ NAMES=(
 mkdir -p "$DEST"
 
 for n in "${NAMES[@]}"; do
-  src="$UPSTREAM/$n.wast"
-  if [ ! -f "$src" ]; then
-    echo "[regen_spec_simd_assert] missing $src" >&2
+  if [ ! -f "$UPSTREAM/$n.wast" ]; then
+    echo "[regen_spec_simd_assert] missing $UPSTREAM/$n.wast" >&2
     exit 1
   fi
+done
+
+. scripts/lib/bake_jobs.sh
+
+bake_one() {
+  local n="$1"
+  local src="$UPSTREAM/$n.wast"
+  local TMP
   TMP=$(mktemp -d)
   trap "rm -rf '$TMP'" EXIT
 
@@ -182,23 +189,30 @@ for n in "${NAMES[@]}"; do
     echo "[regen_spec_simd_assert] skip $n (json-from-wast rejected)" >&2
     rm -rf "$TMP"
     trap - EXIT
-    continue
+    return
   fi
 
-  out_dir="$DEST/$n"
+  local out_dir="$DEST/$n"
   rm -rf "$out_dir"
   mkdir -p "$out_dir"
 
   python3 - "$TMP/$n.json" "$out_dir/manifest.txt" <<'PY'
-import json, sys, struct
+import functools, json, struct, sys
 
 src, dst = sys.argv[1], sys.argv[2]
-d = json.load(open(src))
+with open(src, "rb") as f:
+    d = json.load(f)
 
-# v128 lane sizes (bytes) per wast2json's `lane_type` field.
-LANE_SIZE = {
-    "i8": 1, "i16": 2, "i32": 4, "i64": 8,
-    "f32": 4, "f64": 8,
+# v128 lane size (bytes), lane-width mask + precompiled little-endian
+# unsigned `struct.Struct` per wast2json's `lane_type` field. The format
+# covers all 16 bytes, so one pack call lays out the whole vector; the
+# Struct is compiled once here instead of re-parsing the format per call.
+LANE_PACK = {
+    t: (sz, (1 << (sz * 8)) - 1, struct.Struct(fmt))
+    for t, (sz, fmt) in {
+        "i8": (1, "<16B"), "i16": (2, "<8H"), "i32": (4, "<4I"), "i64": (8, "<2Q"),
+        "f32": (4, "<4I"), "f64": (8, "<2Q"),
+    }.items()
 }
 
 def encode_v128(value, lane_type):
@@ -211,21 +225,17 @@ def encode_v128(value, lane_type):
     Raises ValueError if any lane is a NaN-pattern token
     (`nan:canonical` / `nan:arithmetic`); callers use that signal
     to emit the per-lane `v128_lanes:` form instead."""
-    sz = LANE_SIZE[lane_type]
-    out = bytearray()
+    sz, mask, packer = LANE_PACK[lane_type]
     for lane in value:
         if isinstance(lane, str) and lane.startswith("nan"):
             raise ValueError(f"nan-token-in-lane:{lane}")
-        n = int(lane)
-        # Mask to lane width (wast2json reports negative ints as
-        # decimal strings; Python int conversion handles signedness
-        # but `to_bytes` requires the unsigned modulo).
-        if n < 0:
-            n &= (1 << (sz * 8)) - 1
-        out += n.to_bytes(sz, "little", signed=False)
-    if len(out) != 16:
-        raise ValueError(f"v128 length {len(out)} != 16")
-    return out.hex()
+    # Mask to lane width (wast2json reports negative ints as decimal
+    # strings; int() handles signedness but the unsigned pack format
+    # requires the unsigned modulo). Only negatives need the fold.
+    lanes = [n & mask if n < 0 else n for n in map(int, value)]
+    if len(lanes) * sz != 16:
+        raise ValueError(f"v128 length {len(lanes) * sz} != 16")
+    return packer.pack(*lanes).hex()
 
 # Per-lane NaN-pattern manifest form (chunk 9.9-h-25). Only the
 # FP shapes f32x4 / f64x2 carry `nan:*` tokens (integer lanes are
@@ -244,6 +254,7 @@ def encode_v128_lanes(value, lane_type):
     shape, n_lanes, hex_width = LANE_SHAPE[lane_type]
     if len(value) != n_lanes:
         raise ValueError(f"v128_lanes lane count {len(value)} != {n_lanes}")
+    mask = (1 << (hex_width * 4)) - 1
     parts = []
     for lane in value:
         if lane == "nan:canonical":
@@ -252,22 +263,25 @@ def encode_v128_lanes(value, lane_type):
             parts.append("a")
         else:
             # wast2json emits numeric lane values as decimal strings
-            # (sometimes negative); int() parses both. Mask to the
-            # lane width then format as natural-width hex.
+            # (sometimes negative); int() parses both. Only negatives
+            # need the fold to the lane width; in-range values format
+            # as natural-width hex directly.
             n = int(lane)
-            mask = (1 << (hex_width * 4)) - 1
-            n &= mask
+            if n < 0:
+                n &= mask
             parts.append(f"V{n:0{hex_width}x}")
     return f"v128_lanes:{shape}:" + ",".join(parts)
 
 def fmt_scalar(v):
+    return _fmt_scalar_value(v["type"], v["value"])
+
+@functools.lru_cache(maxsize=None)
+def _fmt_scalar_value(t, val):
     # D-290 baker normalization (wabt → wasm-tools): wabt emitted i32/i64
     # UNSIGNED (4294967295); wasm-tools emits SIGNED (-1). The committed
     # baseline + runner use unsigned decimals — fold negatives to the
     # unsigned lane width. f32/f64 are bit-pattern decimals in both (identical);
     # `nan:*` tokens pass through unchanged.
-    t = v["type"]
-    val = v["value"]
     if t in ("i32", "i64"):
         try:
             n = int(val)
@@ -304,36 +318,40 @@ def fmt_token(v):
     """Format a single arg / result token for the manifest. Returns
     a string starting with `!` to signal an unsupported case (caller
     converts the directive to a skip)."""
+    # Fast path: plain scalars are the bulk of args/results, so test
+    # them before probing for the rarer `either` / v128 shapes.
+    t = v.get("type")
+    if t in ("i32", "i64", "f32", "f64"):
+        return fmt_scalar(v)
     # §17.4 relaxed-SIMD `(either A B)` — 2+ permitted outcomes. Emit
     # `either:<tokA>|<tokB>`; the runner PASSes if `got` matches ANY.
     # Propagate a `!`-bad sub-token (e.g. nan-in-lane) to skip the row.
     # D-290: wabt = top-level `either` list; wasm-tools = nested
     # `{"type":"either","values":[...]}`.
-    alts_list = v["either"] if "either" in v else (v["values"] if v.get("type") == "either" else None)
+    alts_list = v["either"] if "either" in v else (v["values"] if t == "either" else None)
     if alts_list is not None:
         alts = [fmt_token(a) for a in alts_list]
         for a in alts:
             if a.startswith("!"):
                 return a
         return "either:" + "|".join(alts)
-    t = v["type"]
-    if t in ("i32", "i64", "f32", "f64"):
-        return fmt_scalar(v)
     if t == "v128":
         lane_type = v.get("lane_type")
         # NaN-pattern lanes only appear in FP shapes; integer lanes
         # are always bit-exact (verified empirically — see 9.9-h-25
         # commit body). Emit the per-lane form only when needed.
-        if has_nan_lane(v) and lane_type in ("f32", "f64"):
-            try:
-                return encode_v128_lanes(v["value"], lane_type)
-            except ValueError as e:
-                return f"!{e}"
+        # encode_v128 already rejects NaN tokens, so try the common
+        # all-concrete form first and only re-scan for NaN lanes on
+        # the (rare) rejection.
         try:
-            hex_s = encode_v128(v["value"], lane_type)
+            return f"v128:{encode_v128(v['value'], lane_type)}"
         except ValueError as e:
+            if lane_type in ("f32", "f64") and has_nan_lane(v):
+                try:
+                    return encode_v128_lanes(v["value"], lane_type)
+                except ValueError as e2:
+                    return f"!{e2}"
             return f"!{e}"
-        return f"v128:{hex_s}"
     return f"!unsupported-type:{t}"
 
 # Shape gate: which (args, results) signatures the §9.9-c runner
@@ -515,7 +533,7 @@ for c in d["commands"]:
             # Distinguish v128-param from "no entry helper for this
             # shape" so 9.9-e + later widening can grep the manifests
             # for the specific gap.
-            if any(t == "v128" for t in sig[0]):
+            if "v128" in sig[0]:
                 lines.append(f"skip-impl v128-param-pending {a['field']}")
             else:
                 lines.append(f"skip-impl unsupported-shape {sig[0]}->{sig[1]} {a['field']}")
@@ -562,7 +580,7 @@ for c in d["commands"]:
         results = c.get("expected", [])
         sig = (tuple(x["type"] for x in args), tuple(result_type(r) for r in results))
         if sig not in SUPPORTED:
-            if any(t == "v128" for t in sig[0]):
+            if "v128" in sig[0]:
                 lines.append(f"skip-impl v128-param-pending {a['field']}")
             else:
                 lines.append(f"skip-impl assert_trap-unsupported-shape {sig[0]}->{sig[1]} {a['field']}")
@@ -613,6 +631,9 @@ PY
 
   rm -rf "$TMP"
   trap - EXIT
-done
+}
+
+# Bake every SIMD fixture JOBS-wide; a failed bake aborts the regen.
+run_bakes bake_one "${NAMES[@]}"
 
 echo "[regen_spec_simd_assert] re-baked: ${NAMES[*]} → $DEST/"
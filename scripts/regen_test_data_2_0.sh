@@ -125,7 +125,8 @@ for n in "${NAMES[@]}"; do
   python3 - "$TMP/$n.json" "$out_dir/manifest.txt" <<'PY'
 import json, sys
 src, dst = sys.argv[1], sys.argv[2]
-d = json.load(open(src))
+with open(src, 'rb') as f:
+  d = json.load(f)
 lines = []
 for c in d['commands']:
   t = c.get('type')
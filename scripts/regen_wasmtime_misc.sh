@@ -117,7 +117,8 @@ vendor_one() {
   python3 - "$TMP/$name.json" "$out_dir/manifest.txt" "$out_dir/manifest_runtime.txt" <<'PY'
 import json, sys
 src, dst_parse, dst_rt = sys.argv[1], sys.argv[2], sys.argv[3]
-d = json.load(open(src))
+with open(src, 'rb') as f:
+  d = json.load(f)
 parse_lines = []
 rt_lines = []
 
@@ -28,12 +28,17 @@ in an address-space-disjoint band from FuncEntity heap pointers.
 
 # Wasm 3.0 typed-null heap types (newer wasm-tools json-from-wast emits these
 # with NO 'value' field; each denotes a null reference of that bottom type).
-_NULL_REF_TYPES = (
+# frozensets: every fmt_value / kind_alias call probes these, so membership
+# is a hash lookup rather than a tuple scan.
+_NULL_REF_TYPES = frozenset({
     "refnull", "nullref", "nullfuncref", "nullexternref",
     "nullexnref", "nullcontref",
-)
+})
 # Concrete reference value types (may carry a 'value', or be bare = any-non-null).
-_REF_TYPES = ("funcref", "externref", "exnref", "contref", "anyref", "eqref")
+_REF_TYPES = frozenset({"funcref", "externref", "exnref", "contref", "anyref", "eqref"})
+_ALL_REF_TYPES = _NULL_REF_TYPES | _REF_TYPES
+_INT_TYPES = frozenset({"i32", "i64"})
+_FLOAT_TYPES = frozenset({"f32", "f64"})
 
 NULL_TOKEN = "i64:0"
 NONNULL_TOKEN = "i64:nonnull"
@@ -41,7 +46,7 @@ NONNULL_TOKEN = "i64:nonnull"
 
 def is_ref_type(t):
     """True for any reference type tag (concrete or typed-null bottom)."""
-    return t in _NULL_REF_TYPES or t in _REF_TYPES
+    return t in _ALL_REF_TYPES
 
 
 def kind_alias(t):
@@ -81,14 +86,14 @@ def fmt_value(v):
     # Scalars. i32/i64: wasm-tools may emit SIGNED (str or int); the manifest
     # + runner use UNSIGNED width-folded decimals.
     val = v["value"]
-    if t in ("i32", "i64"):
+    if t in _INT_TYPES:
         n = int(val)
         if n < 0:
             n += (1 << 32) if t == "i32" else (1 << 64)
         return "{}:{}".format(t, n)
     # f32/f64: bit-pattern decimals (identical across tools); nan:canonical /
     # nan:arithmetic tokens pass through unchanged for the runner's NaN matcher.
-    if t in ("f32", "f64"):
+    if t in _FLOAT_TYPES:
         return "{}:{}".format(t, val)
 
     raise ValueError("refdialect.fmt_value: unhandled value shape {!r}".format(v))
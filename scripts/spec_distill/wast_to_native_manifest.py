@@ -38,6 +38,11 @@ def fmt(v):
     return f"{t}:{val}"
 
 
+def fmt_list(values):
+    """Space-joined value tokens, or `()` for an empty list."""
+    return ' '.join(map(fmt, values)) if values else '()'
+
+
 def norm_mid(mid):
     if mid and not mid.startswith('$'):
         return '$' + mid
@@ -45,76 +50,104 @@ def norm_mid(mid):
 
 
 def distil(src):
-    return distil_doc(json.load(open(src)))
+    with open(src, 'rb') as f:
+        return distil_doc(json.load(f))
+
+
+def _field_tok(a):
+    amod = norm_mid(a.get('module'))
+    return (amod + '::' + a['field']) if amod else a['field']
+
+
+# One handler per json-from-wast command type; each returns the single
+# manifest line for its command. distil_doc dispatches through the
+# DIRECTIVES table (one dict probe per command) rather than an
+# if/elif chain over the type string.
+def _module(c):
+    mname = norm_mid(c.get('name'))
+    if mname:
+        return 'module ' + mname + ' ' + c['filename']
+    return 'module ' + c['filename']
+
+
+def _assert_return(c):
+    a = c['action']
+    if a.get('type') != 'invoke':
+        return 'skip-impl non-invoke-action'
+    args_s = fmt_list(a.get('args', []))
+    results_s = fmt_list(c.get('expected', []))
+    return f'assert_return {_field_tok(a)} {args_s} -> {results_s}'
+
+
+def _assert_trap(c):
+    a = c['action']
+    amod = norm_mid(a.get('module'))
+    field_raw = a.get('field', '<non-invoke>')
+    field_tok = (amod + '::' + field_raw) if amod else field_raw
+    args = a.get('args', []) if a.get('type') == 'invoke' else []
+    return f'assert_trap {field_tok} {fmt_list(args)}'
+
+
+def _assert_invalid(c):
+    return f'assert_invalid {c.get("filename", "<inline>")}'
+
+
+def _assert_uninstantiable(c):
+    if 'filename' in c:
+        return f'assert_uninstantiable {c["filename"]}'
+    return 'skip-impl directive-assert_uninstantiable-inline'
+
+
+def _assert_unlinkable(c):
+    if 'filename' in c:
+        return f'assert_unlinkable {c["filename"]}'
+    return 'skip-impl directive-assert_unlinkable-inline'
+
+
+def _assert_malformed(c):
+    if c.get('module_type') == 'binary' and 'filename' in c:
+        return f'assert_malformed {c["filename"]}'
+    return 'skip-adr-skip_text_format_parser directive-assert_malformed-text'
+
+
+def _assert_exception(c):
+    a = c.get('action', {})
+    args = a.get('args', []) if a.get('type') == 'invoke' else []
+    field = a.get('field', '<non-invoke>')
+    return f'assert_exception {field} {fmt_list(args)}'
+
+
+def _action(c):
+    a = c.get('action', {})
+    if a.get('type') != 'invoke':
+        return 'skip-impl non-invoke-action'
+    return f'invoke {_field_tok(a)} {fmt_list(a.get("args", []))}'
+
+
+def _register(c):
+    return f'register {c.get("as", "?")}'
+
+
+DIRECTIVES = {
+    'module': _module,
+    'assert_return': _assert_return,
+    'assert_trap': _assert_trap,
+    'assert_invalid': _assert_invalid,
+    'assert_uninstantiable': _assert_uninstantiable,
+    'assert_unlinkable': _assert_unlinkable,
+    'assert_malformed': _assert_malformed,
+    'assert_exception': _assert_exception,
+    'action': _action,
+    'register': _register,
+}
 
 
 def distil_doc(d):
     lines = []
     for c in d['commands']:
         t = c.get('type')
-        if t == 'module':
-            mname = norm_mid(c.get('name'))
-            if mname:
-                lines.append('module ' + mname + ' ' + c['filename'])
-            else:
-                lines.append('module ' + c['filename'])
-        elif t == 'assert_return':
-            a = c['action']
-            if a.get('type') != 'invoke':
-                lines.append('skip-impl non-invoke-action')
-                continue
-            amod = norm_mid(a.get('module'))
-            field_tok = (amod + '::' + a['field']) if amod else a['field']
-            args = a.get('args', [])
-            results = c.get('expected', [])
-            args_s = ' '.join(fmt(x) for x in args) if args else '()'
-            results_s = ' '.join(fmt(x) for x in results) if results else '()'
-            lines.append(f'assert_return {field_tok} {args_s} -> {results_s}')
-        elif t == 'assert_trap':
-            a = c['action']
-            amod = norm_mid(a.get('module'))
-            field_raw = a.get('field', '<non-invoke>')
-            field_tok = (amod + '::' + field_raw) if amod else field_raw
-            args = a.get('args', []) if a.get('type') == 'invoke' else []
-            args_s = ' '.join(fmt(x) for x in args) if args else '()'
-            lines.append(f'assert_trap {field_tok} {args_s}')
-        elif t == 'assert_invalid':
-            lines.append(f'assert_invalid {c.get("filename", "<inline>")}')
-        elif t == 'assert_uninstantiable':
-            if 'filename' in c:
-                lines.append(f'assert_uninstantiable {c["filename"]}')
-            else:
-                lines.append('skip-impl directive-assert_uninstantiable-inline')
-        elif t == 'assert_unlinkable':
-            if 'filename' in c:
-                lines.append(f'assert_unlinkable {c["filename"]}')
-            else:
-                lines.append('skip-impl directive-assert_unlinkable-inline')
-        elif t == 'assert_malformed':
-            if c.get('module_type') == 'binary' and 'filename' in c:
-                lines.append(f'assert_malformed {c["filename"]}')
-            else:
-                lines.append('skip-adr-skip_text_format_parser directive-assert_malformed-text')
-        elif t == 'assert_exception':
-            a = c.get('action', {})
-            args = a.get('args', []) if a.get('type') == 'invoke' else []
-            args_s = ' '.join(fmt(x) for x in args) if args else '()'
-            field = a.get('field', '<non-invoke>')
-            lines.append(f'assert_exception {field} {args_s}')
-        elif t == 'action':
-            a = c.get('action', {})
-            if a.get('type') != 'invoke':
-                lines.append('skip-impl non-invoke-action')
-                continue
-            amod = norm_mid(a.get('module'))
-            field_tok = (amod + '::' + a['field']) if amod else a['field']
-            args = a.get('args', [])
-            args_s = ' '.join(fmt(x) for x in args) if args else '()'
-            lines.append(f'invoke {field_tok} {args_s}')
-        elif t == 'register':
-            lines.append(f'register {c.get("as", "?")}')
-        else:
-            lines.append(f'skip-impl directive-{t}')
+        handler = DIRECTIVES.get(t)
+        lines.append(handler(c) if handler else f'skip-impl directive-{t}')
     return lines
 
 
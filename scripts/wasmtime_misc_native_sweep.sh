@@ -15,10 +15,14 @@
 # Usage:
 #   bash scripts/wasmtime_misc_native_sweep.sh [bucket ...]   # default: all 5
 #
+# Environment:
+#   JOBS — concurrent .wast bakes (see scripts/lib/bake_jobs.sh).
+#
 # Output: /tmp/wmt-native/<bucket>.txt (runner stdout per bucket) +
 #         /tmp/wmt-native/summary.txt (per-bucket passed/failed tally).
 set -uo pipefail
 cd "$(dirname "$0")/.."
+. scripts/lib/bake_jobs.sh
 
 UPSTREAM=${WASMTIME_REPO:-$HOME/Documents/OSS/wasmtime}
 MISC="$UPSTREAM/tests/misc_testsuite"
@@ -41,8 +45,9 @@ CORPUS="$OUT/corpus"
 SUMMARY="$OUT/summary.txt"
 : > "$SUMMARY"
 
+# bake_one <wast> — $bucket is the one the loop below is baking.
 bake_one() {
-  local bucket="$1" wast="$2"
+  local wast="$1"
   local name; name=$(basename "$wast" .wast)
   local out_dir="$CORPUS/$bucket/$name"
   local tmp; tmp=$(mktemp -d)
@@ -71,10 +76,14 @@ bake_one() {
 for bucket in "${BUCKETS[@]}"; do
   src_dir="$MISC/$bucket"
   [ -d "$src_dir" ] || { echo "[native-sweep] no bucket $bucket"; continue; }
-  n=0
-  while IFS= read -r wast; do bake_one "$bucket" "$wast"; n=$((n+1)); done < <(find "$src_dir" -name '*.wast' | sort)
-  echo "[native-sweep] baked $bucket: $n .wast"
+  WASTS=()
+  while IFS= read -r wast; do WASTS+=("$wast"); done < <(find "$src_dir" -name '*.wast' | sort)
+  run_jobs bake_one "${WASTS[@]}"
+  echo "[native-sweep] baked $bucket: ${#WASTS[@]} .wast"
 done
+# CONVFAIL lines land in completion order under JOBS>1 — sort them so the
+# summary diffs cleanly run-to-run.
+sort "$SUMMARY" -o "$SUMMARY"
 
 echo "[native-sweep] running native runner over baked corpus..."
 # The runner enumerates PROPOSALS subdirs under the corpus root.
@@ -20,11 +20,15 @@
 #     bucket = a subdir under misc_testsuite (gc, simd, memory64, ...) or
 #              "top" for the top-level (non-subdir) .wast files. Default: all.
 #
+# Environment:
+#   JOBS — concurrent files (see scripts/lib/bake_jobs.sh).
+#
 # Output:
 #   /tmp/wmt-sweep/summary.txt   per-file verdicts + bucket tallies
 #   /tmp/wmt-sweep/<name>.log    runner output for FAIL files (root-cause)
 set -uo pipefail
 cd "$(dirname "$0")/.."
+. scripts/lib/bake_jobs.sh
 
 UPSTREAM=${WASMTIME_REPO:-$HOME/Documents/OSS/wasmtime}
 MISC="$UPSTREAM/tests/misc_testsuite"
@@ -41,7 +45,8 @@ zig build install >/dev/null 2>&1 || { echo "zig build failed"; exit 1; }
 
 rm -rf "$OUT"; mkdir -p "$OUT"
 SUMMARY="$OUT/summary.txt"
-: > "$SUMMARY"
+VERDICTS="$OUT/verdicts"
+mkdir -p "$VERDICTS"
 
 # Collect target .wast paths (relative to $MISC) per requested buckets.
 declare -a FILES
@@ -57,8 +62,25 @@ else
   done
 fi
 
+# Launch order (indices into FILES). Longest-first (LPT) scheduling: a
+# handful of large .wast files dominate the sweep, so hand them out first
+# rather than letting one start last and set the makespan. `wc -c` reports
+# sizes in argument order on GNU and BSD alike, so line k is FILES[k]; the
+# trailing total line is dropped.
+ORDER=("${!FILES[@]}")
+if [ "$JOBS" -gt 1 ] && [ "${#FILES[@]}" -gt 1 ]; then
+  ORDER=()
+  while IFS= read -r i; do ORDER+=("$i"); done < <(
+    cd "$MISC" && wc -c -- "${FILES[@]}" \
+      | awk -v n="${#FILES[@]}" 'NR <= n { print $1, NR - 1 }' \
+      | sort -k1,1nr -k2,2n | cut -d' ' -f2)
+fi
+
+# run_one <index> — sweep FILES[index]; its verdict line goes to its own
+# slot under $VERDICTS.
 run_one() {
-  local rel="$1"
+  local rel="${FILES[$1]}"
+  local verdict="$VERDICTS/$1"
   local src="$MISC/$rel"
   local tag; tag=$(echo "$rel" | sed 's#/#__#g; s#\.wast$##')
   local tmp; tmp=$(mktemp -d)
@@ -66,40 +88,45 @@ run_one() {
   mkdir -p "$fix"
 
   if ! ( cd "$tmp" && wasm-tools json-from-wast "$src" -o c.json --wasm-dir "$fix" >/dev/null 2>&1 ); then
-    echo "CONVFAIL $rel" >> "$SUMMARY"; rm -rf "$tmp"; return
+    echo "CONVFAIL $rel" > "$verdict"; rm -rf "$tmp"; return
   fi
   python3 "$DISTIL" "$tmp/c.json" "$fix/manifest.txt" "$fix/manifest_runtime.txt" 2>"$tmp/distil.err" || {
-    echo "CONVFAIL $rel (distil)" >> "$SUMMARY"; cp "$tmp/distil.err" "$OUT/$tag.log"; rm -rf "$tmp"; return
+    echo "CONVFAIL $rel (distil)" > "$verdict"; cp "$tmp/distil.err" "$OUT/$tag.log"; rm -rf "$tmp"; return
   }
   # Convert any .wat emissions to .wasm (valid text modules).
   for w in "$fix"/*.wat; do
     [ -e "$w" ] || continue
     wasm-tools parse "$w" -o "${w%.wat}.wasm" >/dev/null 2>&1 || true
   done
-  # EMPTY = no runnable runtime directives (only module/skipped asserts).
-  if ! grep -qE '^(assert_return|assert_trap|assert_unlinkable|assert_uninstantiable|invoke|register)' "$fix/manifest_runtime.txt" 2>/dev/null; then
-    # still meaningful if it instantiates modules; mark EMPTY to flag low signal
-    if ! grep -qE '^module ' "$fix/manifest_runtime.txt" 2>/dev/null; then
-      echo "EMPTY $rel" >> "$SUMMARY"; rm -rf "$tmp"; return
-    fi
+  # EMPTY = no runnable runtime directives AND no module to instantiate
+  # (a module-only manifest is still meaningful). One grep pass: the first
+  # matching line of either kind settles it.
+  if ! grep -qE '^(assert_return|assert_trap|assert_unlinkable|assert_uninstantiable|invoke|register|module )' "$fix/manifest_runtime.txt" 2>/dev/null; then
+    echo "EMPTY $rel" > "$verdict"; rm -rf "$tmp"; return
   fi
 
   if timeout 60 "$RUNNER" "$tmp" >"$tmp/run.log" 2>&1; then
-    echo "PASS $rel" >> "$SUMMARY"
+    echo "PASS $rel" > "$verdict"
   else
-    echo "FAIL $rel" >> "$SUMMARY"
+    echo "FAIL $rel" > "$verdict"
     cp "$tmp/run.log" "$OUT/$tag.log"
   fi
   rm -rf "$tmp"
 }
 
-echo "[sweep] running ${#FILES[@]} .wast files..."
-for rel in "${FILES[@]}"; do run_one "$rel"; done
+echo "[sweep] running ${#FILES[@]} .wast files (JOBS=$JOBS)..."
+run_jobs run_one "${ORDER[@]}"
 
+# Join the slots in FILES order: the summary lists files as collected
+# (buckets in command-line order), whichever job finished first.
+for i in "${!FILES[@]}"; do cat "$VERDICTS/$i"; done > "$SUMMARY"
+rm -rf "$VERDICTS"
+# One pass over the verdicts for all four counts (not a grep per verdict).
+tally=$(awk 'BEGIN { split("PASS FAIL CONVFAIL EMPTY", v, " ") }
+             { n[$1]++ }
+             END { for (i = 1; i <= 4; i++) printf "%-9s %d\n", v[i], n[v[i]] }' "$SUMMARY")
 echo "" >> "$SUMMARY"
 echo "=== tally ===" >> "$SUMMARY"
-for v in PASS FAIL CONVFAIL EMPTY; do
-  printf '%-9s %d\n' "$v" "$(grep -c "^$v " "$SUMMARY")" >> "$SUMMARY"
-done
+echo "$tally" >> "$SUMMARY"
 echo "[sweep] done -> $SUMMARY"
 grep -A10 "=== tally ===" "$SUMMARY"
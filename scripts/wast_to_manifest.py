@@ -16,32 +16,29 @@ import json
 import sys
 
 
+# Per-type (width mask, manifest format). Ints print as unsigned decimals;
+# floats arrive as bit-pattern decimals and print as fixed-width hex (the
+# runner's `f32:0xHEX` / `f64:0xHEX` path). One mask folds wasm-tools'
+# signed emissions into the unsigned width for every scalar kind.
+SCALAR_FORMAT = {
+    'i32': (0xffffffff, 'i32:{}'),
+    'i64': (0xffffffffffffffff, 'i64:{}'),
+    'f32': (0xffffffff, 'f32:0x{:08x}'),
+    'f64': (0xffffffffffffffff, 'f64:0x{:016x}'),
+}
+
+
 def encode_value(v):
-    ty = v.get('type', '')
-    raw = v.get('value', '')
-    if ty == 'i32':
-        try:
-            return f'i32:{int(raw) & 0xffffffff}'
-        except Exception:
-            return None
-    if ty == 'i64':
-        try:
-            return f'i64:{int(raw) & 0xffffffffffffffff}'
-        except Exception:
-            return None
-    if ty == 'f32':
-        try:
-            return f'f32:0x{int(raw) & 0xffffffff:08x}'
-        except Exception:
-            return None
-    if ty == 'f64':
-        try:
-            return f'f64:0x{int(raw) & 0xffffffffffffffff:016x}'
-        except Exception:
-            return None
-    # v128 / externref / funcref / null refs deferred — the runtime runner
-    # doesn't compare those yet. None drops the whole directive.
-    return None
+    spec = SCALAR_FORMAT.get(v.get('type', ''))
+    if spec is None:
+        # v128 / externref / funcref / null refs deferred — the runtime
+        # runner doesn't compare those yet. None drops the whole directive.
+        return None
+    mask, fmt = spec
+    try:
+        return fmt.format(int(v.get('value', '')) & mask)
+    except Exception:
+        return None
 
 
 def norm_wasm(fn):
@@ -82,68 +79,99 @@ TRAP_TAG_MAP = {
 }
 
 
+# DIRECTIVES handlers: handler(c, parse_lines, rt_lines) appends the
+# command's line(s), or nothing to drop it.
+def _module(c, parse_lines, rt_lines):
+    fn = norm_wasm(c['filename'])
+    parse_lines.append('valid ' + fn)
+    line = 'module ' + fn
+    name = c.get('name')
+    if name:
+        line += ' as ' + quote_field(str(name))
+    rt_lines.append(line)
+
+
+def _register(c, parse_lines, rt_lines):
+    line = 'register ' + quote_field(c.get('as', ''))
+    name = c.get('name')
+    if name:
+        line += ' from ' + quote_field(str(name))
+    rt_lines.append(line)
+
+
+def _assert_invalid(c, parse_lines, rt_lines):
+    if c.get('module_type') == 'binary':
+        parse_lines.append('invalid ' + c['filename'])
+
+
+def _assert_malformed(c, parse_lines, rt_lines):
+    if c.get('module_type') == 'binary':
+        parse_lines.append('malformed ' + c['filename'])
+
+
+def _assert_link_failure(c, parse_lines, rt_lines):
+    # assert_unlinkable / assert_uninstantiable: the directive name is
+    # the manifest keyword.
+    if c.get('module_type') == 'binary':
+        rt_lines.append(c['type'] + ' ' + c['filename'])
+
+
+def _assert_return(c, parse_lines, rt_lines):
+    act = c.get('action', {})
+    if act.get('type') != 'invoke':
+        return
+    args = encode_args(act.get('args'))
+    expected = encode_args(c.get('expected'))
+    if args is None or expected is None:
+        return
+    rt_lines.append(' '.join(['assert_return', quote_field(act.get('field', '')),
+                              *args, '->', *expected]).rstrip())
+
+
+def _action(c, parse_lines, rt_lines):
+    act = c.get('action', {})
+    if act.get('type') != 'invoke':
+        return
+    args = encode_args(act.get('args'))
+    if args is None:
+        return
+    rt_lines.append(' '.join(['invoke', quote_field(act.get('field', '')), *args]).rstrip())
+
+
+def _assert_trap(c, parse_lines, rt_lines):
+    act = c.get('action', {})
+    if act.get('type') != 'invoke':
+        return
+    args = encode_args(act.get('args'))
+    if args is None:
+        return
+    kind = TRAP_TAG_MAP.get(c.get('text', ''), 'Unreachable')
+    rt_lines.append(' '.join(['assert_trap', quote_field(act.get('field', '')),
+                              *args, '!!', kind]))
+
+
+DIRECTIVES = {
+    'module': _module,
+    'register': _register,
+    'assert_invalid': _assert_invalid,
+    'assert_malformed': _assert_malformed,
+    'assert_unlinkable': _assert_link_failure,
+    'assert_uninstantiable': _assert_link_failure,
+    'assert_return': _assert_return,
+    'action': _action,
+    'assert_trap': _assert_trap,
+}
+
+
 def distil(src):
-    d = json.load(open(src))
+    with open(src, 'rb') as f:
+        d = json.load(f)
     parse_lines = []
     rt_lines = []
     for c in d['commands']:
-        t = c.get('type')
-        if t == 'module':
-            fn = norm_wasm(c['filename'])
-            parse_lines.append('valid ' + fn)
-            line = 'module ' + fn
-            name = c.get('name')
-            if name:
-                line += ' as ' + quote_field(str(name))
-            rt_lines.append(line)
-        elif t == 'register':
-            line = 'register ' + quote_field(c.get('as', ''))
-            name = c.get('name')
-            if name:
-                line += ' from ' + quote_field(str(name))
-            rt_lines.append(line)
-        elif t in ('assert_invalid', 'assert_malformed') and c.get('module_type') == 'binary':
-            kind = 'invalid' if t == 'assert_invalid' else 'malformed'
-            parse_lines.append(kind + ' ' + c['filename'])
-        elif t in ('assert_unlinkable', 'assert_uninstantiable') and c.get('module_type') == 'binary':
-            rt_lines.append(t + ' ' + c['filename'])
-        elif t == 'assert_return':
-            act = c.get('action', {})
-            if act.get('type') != 'invoke':
-                continue
-            args = encode_args(act.get('args'))
-            expected = encode_args(c.get('expected'))
-            if args is None or expected is None:
-                continue
-            rt_line = 'assert_return ' + quote_field(act.get('field', ''))
-            if args:
-                rt_line += ' ' + ' '.join(args)
-            rt_line += ' -> ' + (' '.join(expected) if expected else '')
-            rt_lines.append(rt_line.rstrip())
-        elif t == 'action':
-            act = c.get('action', {})
-            if act.get('type') != 'invoke':
-                continue
-            args = encode_args(act.get('args'))
-            if args is None:
-                continue
-            rt_line = 'invoke ' + quote_field(act.get('field', ''))
-            if args:
-                rt_line += ' ' + ' '.join(args)
-            rt_lines.append(rt_line.rstrip())
-        elif t == 'assert_trap':
-            act = c.get('action', {})
-            if act.get('type') != 'invoke':
-                continue
-            args = encode_args(act.get('args'))
-            if args is None:
-                continue
-            kind = TRAP_TAG_MAP.get(c.get('text', ''), 'Unreachable')
-            rt_line = 'assert_trap ' + quote_field(act.get('field', ''))
-            if args:
-                rt_line += ' ' + ' '.join(args)
-            rt_line += ' !! ' + kind
-            rt_lines.append(rt_line)
+        handler = DIRECTIVES.get(c.get('type'))
+        if handler:
+            handler(c, parse_lines, rt_lines)
     return parse_lines, rt_lines
 
 
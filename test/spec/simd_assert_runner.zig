@@ -288,12 +288,12 @@ const parseV128Token = base.parseV128Token;
 // semantics: a canonical NaN has exponent all-1s and mantissa =
 // `1 << (mantissa_width - 1)` (sign arbitrary); an arithmetic
 // NaN is any quiet NaN (exponent all-1s, mantissa MSB = 1).
+//
+// A lane expectation is the same three-way spec as a scalar FP
+// result, so lanes reuse `base.ScalarFpSpec` and match through
+// `base.matchScalarF32/F64` (one masked compare per NaN class).
 const LaneShape = enum { f32x4, f64x2 };
-const LaneSpec = union(enum) {
-    canonical,
-    arithmetic,
-    exact: u64,
-};
+const LaneSpec = base.ScalarFpSpec;
 
 const ParsedV128Lanes = struct {
     shape: LaneShape,
@@ -338,25 +338,6 @@ fn parseV128LanesToken(s: []const u8) !ParsedV128Lanes {
     return out;
 }
 
-fn matchLaneF32(got_bits: u32, spec: LaneSpec) bool {
-    return switch (spec) {
-        // Canonical NaN: sign-agnostic ±0x7fc00000.
-        .canonical => got_bits == 0x7fc00000 or got_bits == 0xffc00000,
-        // Arithmetic NaN: exp all-1s + mantissa MSB = 1
-        // (= any quiet NaN, includes canonical).
-        .arithmetic => (got_bits & 0x7fc00000) == 0x7fc00000,
-        .exact => |bits| got_bits == @as(u32, @intCast(bits & 0xffffffff)),
-    };
-}
-
-fn matchLaneF64(got_bits: u64, spec: LaneSpec) bool {
-    return switch (spec) {
-        .canonical => got_bits == 0x7ff8000000000000 or got_bits == 0xfff8000000000000,
-        .arithmetic => (got_bits & 0x7ff8000000000000) == 0x7ff8000000000000,
-        .exact => |bits| got_bits == bits,
-    };
-}
-
 /// §17.4 relaxed-SIMD — does `got` match one `(either)` alternative token?
 /// `tok` is `v128:<hex>` (bit-exact) or `v128_lanes:<shape>:...` (NaN-aware
 /// per-lane). Returns false (not error) on a malformed token so the caller's
@@ -373,14 +354,14 @@ fn v128MatchesToken(got: [16]u8, tok: []const u8) bool {
                 var lane: usize = 0;
                 while (lane < 4) : (lane += 1) {
                     const bits = std.mem.readInt(u32, got[lane * 4 ..][0..4], .little);
-                    if (!matchLaneF32(bits, parsed.lanes[lane])) return false;
+                    if (!base.matchScalarF32(bits, parsed.lanes[lane])) return false;
                 }
             },
             .f64x2 => {
                 var lane: usize = 0;
                 while (lane < 2) : (lane += 1) {
                     const bits = std.mem.readInt(u64, got[lane * 8 ..][0..8], .little);
-                    if (!matchLaneF64(bits, parsed.lanes[lane])) return false;
+                    if (!base.matchScalarF64(bits, parsed.lanes[lane])) return false;
                 }
             },
         }
@@ -576,7 +557,7 @@ fn runAssertReturn(
                 while (lane < 4) : (lane += 1) {
                     const off = lane * 4;
                     const bits = std.mem.readInt(u32, got[off..][0..4], .little);
-                    if (!matchLaneF32(bits, parsed.lanes[lane])) {
+                    if (!base.matchScalarF32(bits, parsed.lanes[lane])) {
                         try stdout.print(
                             "FAIL  {s}: {s}({s}) → f32x4 lane {d}: got 0x{x:0>8} vs {s}\n",
                             .{ name, fn_name, args_s, lane, bits, laneSpecName(parsed.lanes[lane]) },
@@ -590,7 +571,7 @@ fn runAssertReturn(
                 while (lane < 2) : (lane += 1) {
                     const off = lane * 8;
                     const bits = std.mem.readInt(u64, got[off..][0..8], .little);
-                    if (!matchLaneF64(bits, parsed.lanes[lane])) {
+                    if (!base.matchScalarF64(bits, parsed.lanes[lane])) {
                         try stdout.print(
                             "FAIL  {s}: {s}({s}) → f64x2 lane {d}: got 0x{x:0>16} vs {s}\n",
                             .{ name, fn_name, args_s, lane, bits, laneSpecName(parsed.lanes[lane]) },
@@ -2493,23 +2493,24 @@ pub fn parseScalarFpExpected(value_s: []const u8, bits: u8) !ScalarFpSpec {
 }
 
 /// Compare a f32 result's bit pattern against the expected spec.
-/// Canonical NaN: sign-agnostic ±0x7fc00000. Arithmetic NaN:
+/// Canonical NaN: sign-agnostic ±0x7fc00000 — the sign bit is masked
+/// off so both signs collapse into one compare. Arithmetic NaN:
 /// exponent all-1s + mantissa MSB = 1 (= any quiet NaN, includes
 /// canonical). Exact: u32 bit-pattern equality.
 pub fn matchScalarF32(got_bits: u32, spec: ScalarFpSpec) bool {
     return switch (spec) {
-        .canonical => got_bits == 0x7fc00000 or got_bits == 0xffc00000,
+        .canonical => (got_bits & 0x7fffffff) == 0x7fc00000,
         .arithmetic => (got_bits & 0x7fc00000) == 0x7fc00000,
         .exact => |bits| got_bits == @as(u32, @intCast(bits & 0xffffffff)),
     };
 }
 
 /// f64 mirror of `matchScalarF32`. Canonical NaN bit pattern is
-/// `±0x7ff8000000000000`; arithmetic is any quiet NaN
-/// (exp all-1s + mantissa MSB = 1).
+/// `±0x7ff8000000000000` (sign masked, one compare); arithmetic is
+/// any quiet NaN (exp all-1s + mantissa MSB = 1).
 pub fn matchScalarF64(got_bits: u64, spec: ScalarFpSpec) bool {
     return switch (spec) {
-        .canonical => got_bits == 0x7ff8000000000000 or got_bits == 0xfff8000000000000,
+        .canonical => (got_bits & 0x7fffffffffffffff) == 0x7ff8000000000000,
         .arithmetic => (got_bits & 0x7ff8000000000000) == 0x7ff8000000000000,
         .exact => |bits| got_bits == bits,
     };
@@ -3919,6 +3920,8 @@ test "matchScalarF32: canonical NaN sign-agnostic" {
     try testing.expect(matchScalarF32(0x7fc00000, .canonical));
     try testing.expect(matchScalarF32(0xffc00000, .canonical));
     try testing.expect(!matchScalarF32(0x7fc00001, .canonical));
+    try testing.expect(!matchScalarF32(0xffc00001, .canonical));
+    try testing.expect(!matchScalarF32(0x7f800000, .canonical));
 }
 
 test "matchScalarF32: arithmetic NaN accepts any quiet NaN" {
@@ -3937,6 +3940,8 @@ test "matchScalarF32: exact bit-pattern equality" {
 test "matchScalarF64: canonical / arithmetic / exact" {
     try testing.expect(matchScalarF64(0x7ff8000000000000, .canonical));
     try testing.expect(matchScalarF64(0xfff8000000000000, .canonical));
+    try testing.expect(!matchScalarF64(0xfff8000000000001, .canonical));
+    try testing.expect(!matchScalarF64(0x7ff0000000000000, .canonical));
     try testing.expect(matchScalarF64(0x7ff8000000000001, .arithmetic));
     try testing.expect(!matchScalarF64(0x7ff0000000000001, .arithmetic));
     try testing.expect(matchScalarF64(0xdeadbeef, .{ .exact = 0xdeadbeef }));